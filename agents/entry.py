@@ -1,4 +1,8 @@
+import functools
 import json
+import importlib
+import sys
+from typing import Any, Awaitable, Callable
 from livekit.agents import JobContext
 from bamboo_shared.logger import get_logger
 
@@ -19,38 +23,87 @@ class UnsupportedRoomTypeError(AgentRoutingError):
     """Raised when room type is not supported"""
     pass
 
+
+# room_type -> "module:attr" of its entrypoint, replaced by the resolved function on first use
+_ROUTES: dict[str, Any] = {
+    "vocabulary": "agents.vocab:vocab_entrypoint",
+    "onboarding": "agents.onboarding:onboarding_entrypoint",
+    "official_website": "agents.official_website:official_website_entrypoint",
+}
+
+_REQUIRED_FIELDS = frozenset(("room_type",))
+
+# Extra metadata fields required by specific room types
+_ROOM_REQUIRED_FIELDS: dict[str, frozenset[str]] = {
+    "vocabulary": frozenset(("word_id",)),
+}
+
+
 def _validate_metadata(metadata_dict: dict) -> None:
     """Validate metadata contains required fields"""
-    required_fields = ["room_type"]
-    missing_fields = [field for field in required_fields if field not in metadata_dict]
-    
+    missing_fields = _REQUIRED_FIELDS.difference(metadata_dict)
+
     if missing_fields:
-        raise InvalidMetadataError(f"Missing required fields: {missing_fields}")
-    
+        raise InvalidMetadataError(f"Missing required fields: {sorted(missing_fields)}")
+
+
+def _validate_room_metadata(room_type: str, metadata_dict: dict) -> None:
+    """Validate metadata contains the fields required by the given room type"""
+    missing_fields = _ROOM_REQUIRED_FIELDS.get(room_type, frozenset()).difference(metadata_dict)
+
+    if missing_fields:
+        raise InvalidMetadataError(f"Missing required fields for {room_type}: {sorted(missing_fields)}")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_and_validate(metadata_str: str) -> tuple[dict, str]:
+    """Parse and validate job metadata, returning it with its normalized room_type"""
+    try:
+        metadata = json.loads(metadata_str)
+    except json.JSONDecodeError as e:
+        raise InvalidMetadataError(f"Invalid JSON metadata: {e}") from e
+    _validate_metadata(metadata)
+
+    room_type = sys.intern(metadata["room_type"].casefold())
+    if room_type not in _ROUTES:
+        raise UnsupportedRoomTypeError(f"Unsupported room type: {room_type}")
+    _validate_room_metadata(room_type, metadata)
+    return metadata, room_type
+
+
+def _resolve(room_type: str) -> Callable[[JobContext, dict], Awaitable[None]]:
+    """Resolve the entrypoint for a room type, importing its module on first use"""
+    target = _ROUTES.get(room_type)
+    if target is None:
+        raise UnsupportedRoomTypeError(f"Unsupported room type: {room_type}")
+
+    if isinstance(target, str):
+        module_path, attr = target.split(":")
+        target = getattr(importlib.import_module(module_path), attr)
+        _ROUTES[room_type] = target
+
+    return target
+
+
+def prewarm_routes() -> None:
+    """Import every route's entrypoint module; must run on the main thread of the worker process"""
+    for room_type in tuple(_ROUTES):
+        _resolve(room_type)
+
 
 async def entrypoint(ctx: JobContext):
     """Main entrypoint that routes to different agents based on metadata.type"""
     try:
-        metadata = json.loads(ctx.job.metadata)
-        await ctx.connect()
-        _validate_metadata(metadata)
-        
-        room_type = metadata["room_type"].lower()
+        cached_metadata, room_type = _parse_and_validate(ctx.job.metadata)
+        # the parsed dict is shared through the cache, hand out a copy
+        metadata = dict(cached_metadata)
         logger.info(f"Routing to agent type: {room_type}")
-        
-        if room_type == "vocabulary":
-            from agents.vocab import vocab_entrypoint
-            await vocab_entrypoint(ctx, metadata)
-        
-        elif room_type == "onboarding":
-            from agents.onboarding import onboarding_entrypoint
-            await onboarding_entrypoint(ctx, metadata)
-        
-        elif room_type == "official_website":
-            from agents.official_website import official_website_entrypoint
-            await official_website_entrypoint(ctx, metadata)
-        else:
-            raise UnsupportedRoomTypeError(f"Unsupported room type: {room_type}")
+
+        # livekit plugins must be registered on the main thread, so resolve on the event loop;
+        # the route modules are already imported by the worker prewarm
+        agent_entrypoint = _resolve(room_type)
+        await ctx.connect()
+        await agent_entrypoint(ctx, metadata)
     
     except (InvalidMetadataError, UnsupportedRoomTypeError) as e:
         logger.error(f"Agent routing error: {e}")
@@ -1,5 +1,3 @@
-from .entry import official_website_entrypoint
-
 # New Base Template with placeholders
 BASE_INSTRUCTION_TEMPLATE = """
 System context:
@@ -18,4 +16,15 @@ Your specific task:
 __all__ = [
     "official_website_entrypoint",
     "BASE_INSTRUCTION_TEMPLATE"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import the entrypoint on first access so importing the package stays cheap"""
+    if name == "official_website_entrypoint":
+        from .entry import official_website_entrypoint
+
+        globals()[name] = official_website_entrypoint
+        return official_website_entrypoint
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -0,0 +1,26 @@
+import functools
+from importlib import resources
+
+
+def _read(name: str) -> str:
+    return resources.files(__package__).joinpath("prompts", f"{name}.md").read_text(encoding="utf-8")
+
+
+@functools.cache
+def chat_instructions() -> str:
+    return _read("chat")
+
+
+@functools.cache
+def scene_instructions() -> str:
+    return _read("scene")
+
+
+@functools.cache
+def writing_instructions() -> str:
+    return _read("writing")
+
+
+@functools.cache
+def vocabulary_instructions() -> str:
+    return _read("vocabulary")
@@ -0,0 +1,20 @@
+def get_tts(
+    voice_id: str,
+    sample_rate: int = 32000,
+    bitrate: int = 128000,
+    emotion: str = "happy",
+    model: str = "speech-02-turbo",
+):
+    """Create a Minimax TTS with the official website voice settings
+
+    Not cached: the instance holds the job-scoped http session, so it must not outlive its session.
+    """
+    from plugins.minimax.tts import TTS as MinimaxTTS
+
+    return MinimaxTTS(
+        model=model,
+        voice_id=voice_id,
+        sample_rate=sample_rate,
+        bitrate=bitrate,
+        emotion=emotion,
+    )
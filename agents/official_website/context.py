@@ -1,18 +1,13 @@
 from datetime import datetime
-from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Dict
-import pytz
 from bamboo_shared.enums.official_website import OfficialWebsitePhase
-from bamboo_shared.repositories import ChatRepository
 from agents.official_website.service.message_service import MessageService
 from bamboo_shared.logger import get_logger
 from livekit.agents.llm.chat_context import ChatContext
-import asyncio
 
 logger = get_logger(__name__)
 
-
-@dataclass
 class Context:
     """official_website learning context"""
 
@@ -22,13 +17,21 @@ class Context:
     phase: OfficialWebsitePhase
     last_communication_time: datetime | None
 
+    CHARACTER_NAMES = MappingProxyType({
+        "vocabulary": "Haley",
+        "scene": "Samul",
+        "writing": "Felicia",
+        "chat": "Doug",
+    })
+
+    __slots__ = ("visitor_id", "current_word", "chat_context", "phase", "last_communication_time")
+
     def __init__(self, visitor_id: str, current_word: str, chat_context: ChatContext, phase: OfficialWebsitePhase, last_communication_time: datetime | None):
         self.visitor_id = visitor_id
         self.current_word = current_word
         self.chat_context = chat_context
         self.phase = phase
         self.last_communication_time = last_communication_time
-        self.chat_repo = ChatRepository(0)
 
     def get_metadata(self) -> Dict[str, Any]:
         return {
@@ -41,25 +44,17 @@ class Context:
     def update_phase(self, phase: OfficialWebsitePhase):
         self.phase = phase
 
-    def get_character_name(self, value: str) -> str:
-        phase_description = {
-            "vocabulary": "Haley",
-            "scene": "Samul",
-            "writing": "Felicia",
-            "chat": "Doug",
-        }
-        return phase_description[value]
-
 
 class AgentContext(Context):
+    __slots__ = ()
+
     def __init__(self, visitor_id: str):
         self.visitor_id = visitor_id
+        # 官网用于演示的单词列表,随机选择一个
+        self.current_word = "item"
 
     async def initialize_async_context(self):
-        await asyncio.gather(
-            self._initialize_chat_context(),
-            self._initialize_word(),
-        )
+        await self._initialize_chat_context()
 
     async def _initialize_chat_context(self):
         message_service = MessageService(self.visitor_id)
@@ -67,7 +62,3 @@ class AgentContext(Context):
         self.chat_context = chat_context
         self.phase = phase
         self.last_communication_time = last_communication_time
-
-    async def _initialize_word(self):
-        # 官网用于演示的单词列表,随机选择一个
-        self.current_word = "item"
\ No newline at end of file
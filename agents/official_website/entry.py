@@ -1,4 +1,3 @@
-from dotenv import load_dotenv
 import json
 import asyncio
 from livekit.rtc import DataPacket
@@ -13,7 +12,6 @@ from agents.official_website.agents.writing import WritingAgent
 
 import random
 
-load_dotenv(dotenv_path=".env.local")
 install_mixed_language_tokenize()
 
 from dataclasses import dataclass
@@ -30,11 +28,64 @@ from livekit.agents.voice import MetricsCollectedEvent
 from livekit.plugins import openai
 from livekit.plugins import noise_cancellation
 from plugins.aliyun.stt import AliSTT
-from plugins.minimax.tts import TTS as MinimaxTTS
+from agents.official_website.agents._tts import get_tts
 from bamboo_shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SWITCH_PHRASES = ("上!", "该你了!", "Over to you!")
+_SWITCH_ANNOUNCEMENT = "Sure，{name}, {phrase}"
+_PHASE_BY_VALUE = {phase.value: phase for phase in OfficialWebsitePhase}
+# phase values are plain identifiers, so they need no JSON escaping
+_AGENT_SWITCHED_TMPL = b'{"type":"agent_switched","phase":"%b"}'
+_FAIL_PREFIX = b'{"type":"agent_switch_failed","phase":"","error":'
+_FAIL_SUFFIX = b'}'
+_AGENT_BY_PHASE = {
+    OfficialWebsitePhase.VOCABULARY: VocabularyAgent,
+    OfficialWebsitePhase.SCENE: SceneAgent,
+    OfficialWebsitePhase.WRITING: WritingAgent,
+    OfficialWebsitePhase.CHAT: ChatAgent,
+}
+
+
+class _ControlChannel:
+    """Publish agent_control messages in order from a single background task"""
+
+    def __init__(self, room):
+        self._room = room
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def send(self, payload: bytes) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._queue.put_nowait(payload)
+
+    async def _run(self) -> None:
+        while True:
+            payload = await self._queue.get()
+            try:
+                await self._room.local_participant.publish_data(
+                    payload,
+                    reliable=True,
+                    topic="agent_control"
+                )
+            except Exception as e:
+                logger.error(f"发送控制消息失败: {e}")
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+def get_agent_by_phase(phase: OfficialWebsitePhase, chat_ctx: ChatContext):
+    """根据阶段创建对应的 Agent"""
+    agent_cls = _AGENT_BY_PHASE.get(phase)
+    if agent_cls is None:
+        raise ValueError(f"Invalid phase: {phase}")
+    return agent_cls(chat_ctx=chat_ctx)
+
 
 async def official_website_entrypoint(ctx: JobContext, metadata: dict):
     """Entrypoint for official_website learning agents"""
@@ -46,13 +97,7 @@ async def official_website_entrypoint(ctx: JobContext, metadata: dict):
         vad=ctx.proc.userdata["vad"],
         llm=openai.LLM(model="gpt-4.1"),
         stt=AliSTT(),
-        tts=MinimaxTTS(
-            model="speech-02-turbo",
-            voice_id="Chinese (Mandarin)_Gentle_Senior",
-            sample_rate=32000,
-            bitrate=128000,
-            emotion="happy"
-        ),
+        tts=get_tts(voice_id="Chinese (Mandarin)_Gentle_Senior"),
         # tts=cartesia.TTS(
         #     voice="7d6adbc0-3c4f-4213-9030-50878d391ccd",
         #     language="zh",
@@ -74,34 +119,19 @@ async def official_website_entrypoint(ctx: JobContext, metadata: dict):
 
     ctx.add_shutdown_callback(log_usage)
 
-    logger.info(f"session started")
+    control = _ControlChannel(ctx.room)
+    ctx.add_shutdown_callback(control.aclose)
 
-    def get_agent_by_phase(phase: OfficialWebsitePhase, chat_ctx: ChatContext):
-        """根据阶段创建对应的 Agent"""
-        match phase:
-            case OfficialWebsitePhase.VOCABULARY:
-                return VocabularyAgent(chat_ctx=chat_ctx)
-            case OfficialWebsitePhase.SCENE:
-                return SceneAgent(chat_ctx=chat_ctx)
-            case OfficialWebsitePhase.WRITING:
-                return WritingAgent(chat_ctx=chat_ctx)
-            case OfficialWebsitePhase.CHAT:
-                return ChatAgent(chat_ctx=chat_ctx)
-            case _:
-                raise ValueError(f"Invalid phase: {phase}")
+    logger.info(f"session started")
 
     async def switch_agent(phase: OfficialWebsitePhase):
-        asyncio.create_task(
-            ctx.room.local_participant.publish_data(
-                payload=json.dumps({"type": "agent_switched", "phase": phase.value}).encode("utf-8"),
-                reliable=True,
-                topic="agent_control"
-            )
-        )
+        control.send(_AGENT_SWITCHED_TMPL % phase.value.encode())
         session.interrupt()
-        phrases = ["上!", "该你了!", "Over to you!"]
-        selected_phrase = random.choice(phrases)
-        await session.say(text=f"Sure，{context.get_character_name(phase.value)}, {selected_phrase}")
+        announcement = _SWITCH_ANNOUNCEMENT.format(
+            name=context.CHARACTER_NAMES[phase.value],
+            phrase=random.choice(_SWITCH_PHRASES),
+        )
+        await session.say(text=announcement)
         context.update_phase(phase)
         agent = get_agent_by_phase(context.phase, session._chat_ctx)
         
@@ -111,24 +141,16 @@ async def official_website_entrypoint(ctx: JobContext, metadata: dict):
     @ctx.room.on("data_received")
     def _on_data_received(payload: DataPacket):
         try:
-            data = json.loads(payload.data.decode("utf-8"))
+            data = json.loads(payload.data)
             if data.get("type") == "switch_agent":
                 phase_str = data.get("phase")
-                try:
-                    phase = OfficialWebsitePhase(phase_str)
-                except ValueError:
+                phase = _PHASE_BY_VALUE.get(phase_str)
+                if phase is None:
                     raise ValueError(f"Unknown phase string: {phase_str}")
                 asyncio.create_task(switch_agent(phase))
         except Exception as e:
             logger.error(f"处理消息失败: {e}")
-            asyncio.create_task(
-                ctx.room.local_participant.publish_data(
-                    json.dumps({"type": "agent_switch_failed", "phase": "", "error": str(e)}).encode(
-                        "utf-8"),
-                    reliable=True,
-                    topic="agent_control"
-                )
-            )
+            control.send(_FAIL_PREFIX + json.dumps(str(e)).encode("utf-8") + _FAIL_SUFFIX)
 
     await session.start(
         agent=VocabularyAgent(chat_ctx=ChatContext()),
@@ -11,9 +11,19 @@ from livekit.plugins import openai, noise_cancellation
 from plugins.aliyun.stt import AliSTT
 from plugins.minimax.tts import TTS as MinimaxTTS
 from bamboo_shared.logger import get_logger
+import functools
 
 logger = get_logger(__name__)
 
+_GREETING_TEMPLATE = "你好！我是你的AI助手。{topic_line} 有什么我可以帮助你的吗？"
+
+
+@functools.lru_cache(maxsize=128)
+def _greeting(topic: str | None) -> str:
+    """Opening instructions per topic, the same string is reused across sessions"""
+    topic_line = f" 今天我们可以聊聊关于{topic}的话题。" if topic else ""
+    return _GREETING_TEMPLATE.format(topic_line=topic_line)
+
 class OnboardingAgent(Agent):
     def __init__(self, topic: str) -> None:
         instructions = f"""
@@ -26,13 +36,8 @@ class OnboardingAgent(Agent):
         self.topic = topic
 
     async def on_enter(self):
-        greeting = "你好！我是你的AI助手。"
-        if self.topic:
-            greeting += f" 今天我们可以聊聊关于{self.topic}的话题。"
-        greeting += " 有什么我可以帮助你的吗？"
-        
         await self.session.generate_reply(
-            instructions=greeting,
+            instructions=_greeting(self.topic),
             allow_interruptions=False
         )
 
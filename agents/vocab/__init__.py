@@ -18,4 +18,5 @@ Your specific task:
 __all__ = [
     "vocab_entrypoint",
     "BASE_INSTRUCTION_TEMPLATE"
-]
\ No newline at end of file
+]
+
@@ -0,0 +1,78 @@
+from livekit.agents.llm import function_tool
+from livekit.agents.llm.chat_context import ChatMessage
+from agents.vocab.context import AgentContext, HISTORY_MAX_ITEMS
+from bamboo_shared.logger import get_logger
+from livekit.agents import Agent as LivekitAgent
+from bamboo_shared.models import UserWrittenSentence
+from bamboo_shared.enums.vocabulary import SentenceType
+from livekit import rtc
+
+logger = get_logger(__name__)
+
+
+class VocabTeachingAgent(LivekitAgent):
+    """Base of the vocab teaching agents, sharing the context wiring and sentence evaluation tool"""
+
+    def __init__(self, context: AgentContext, room: rtc.Room, instructions: str) -> None:
+        self.context = context
+        self.room = room
+        chat_ctx = context.chat_context.copy().truncate(max_items=HISTORY_MAX_ITEMS)
+        if context.history_summary:
+            chat_ctx.items.insert(0, ChatMessage(
+                role="system",
+                content=[f"Summary of the earlier conversation: {context.history_summary}"],
+            ))
+        super().__init__(
+            instructions=instructions,
+            chat_ctx=chat_ctx
+        )
+
+    async def on_enter(self):
+        await self.session.generate_reply()
+
+    @function_tool
+    async def save_sentence_evaluation(
+        self,
+        sentence: str,
+        grammar_accuracy: int,
+        vocabulary_proficiency: int,
+        sentence_complexity: int,
+        sentence_type: SentenceType,
+        explanation: str,
+        corrected_sentence: str,
+        native_sentence: str,
+        user_sentence_mean_cn: str
+    ):
+        """
+        Save the sentence evaluation result
+        
+        Args:
+            sentence: 用户提供的原始句子
+            grammar_accuracy: 语法准确性评分(0-10分)
+            vocabulary_proficiency: 词汇运用评分(0-10分)
+            sentence_complexity: 句子复杂度评分(0-10分)
+            sentence_type: 句子类型(1-简单句, 2-复合句, 3-复杂句)
+            explanation: 评分解释和详细反馈
+            corrected_sentence: 语法或表达的修改建议
+            native_sentence: 更地道、自然的表达方式
+            user_sentence_mean_cn: 用户句子的中文含义
+        
+        Returns:
+            操作结果确认信息
+        """
+        # 评估结果无需等待写库，后台保存，避免阻塞下一轮回复
+        self.context.save_sentence_in_background(UserWrittenSentence(
+            user_id=self.context.user_id,
+            chat_id=self.context.chat_id,
+            word_id=self.context.word.id,
+            user_sentence=sentence,
+            user_sentence_mean_cn=user_sentence_mean_cn,
+            grammar_accuracy=grammar_accuracy,
+            vocabulary_proficiency=vocabulary_proficiency,
+            sentence_complexity=sentence_complexity,
+            sentence_type=sentence_type,
+            gpt_analyze=explanation,
+            gpt_corrected_sentence=corrected_sentence,
+            gpt_native_sentence=native_sentence,
+        ))
+        return "evaluation saved"
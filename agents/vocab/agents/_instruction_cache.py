@@ -0,0 +1,54 @@
+import functools
+import time
+
+from bamboo_shared.agent.instructions import TemplateVariables, get_instructions
+
+# Instructions are hosted on Nacos, so rendered results only live for one TTL bucket
+# to let config updates take effect without a restart.
+_TTL = 60.0
+
+
+@functools.lru_cache(maxsize=512)
+def _render(
+    instruction_key: str,
+    voice_mode: bool,
+    ttl_bucket: int,
+    word: str,
+    nickname: str,
+    user_english_level: str,
+    user_characteristics: str,
+    similar_words: str | None,
+) -> str:
+    kwargs = {}
+    if similar_words is not None:
+        kwargs["similar_words"] = similar_words
+    template_variables = TemplateVariables(
+        word=word,
+        nickname=nickname,
+        user_english_level=user_english_level,
+        user_characteristics=user_characteristics,
+        **kwargs,
+    )
+    return get_instructions(template_variables, instruction_key, voice_mode=voice_mode)
+
+
+def render_instructions(
+    instruction_key: str,
+    word: str,
+    nickname: str,
+    user_english_level: str,
+    user_characteristics: str,
+    similar_words: str | None = None,
+    voice_mode: bool = False,
+) -> str:
+    """Render agent instructions, reusing the result for identical variables within the TTL"""
+    return _render(
+        instruction_key,
+        voice_mode,
+        int(time.monotonic() // _TTL),
+        word,
+        nickname,
+        user_english_level,
+        user_characteristics,
+        similar_words,
+    )
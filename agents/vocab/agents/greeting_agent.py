@@ -1,77 +1,101 @@
 from datetime import datetime
+import functools
+import time
 from livekit.agents import (
     RunContext,
 )
 from livekit.agents.llm import function_tool
-import pytz
+from zoneinfo import ZoneInfo
 
 from agents.vocab.context import AgentContext
+from bamboo_shared.enums.vocabulary import VocabularyPhase
 from bamboo_shared.logger import get_logger
 from livekit.agents import Agent as LivekitAgent
 from livekit.agents.llm.chat_context import ChatMessage as LivekitChatMessage
 from bamboo_shared.agent.instructions import prompt_with_voice_mindset_instructions
 from livekit import rtc
+# Agent classes are resolved through module references, the same way the teaching agents refer to each other
+from agents.vocab.agents import main_schedule_agent, route_analysis
 
 logger = get_logger(__name__)
 
+_BEIJING_TZ = ZoneInfo('Asia/Shanghai')
+# 注入问候指令的历史消息条数上限
+_HISTORY_WINDOW = 20
+_ROLE_PREFIX = {"user": "User：", "assistant": "AI Teacher："}
+# 静态部分在前、用户相关内容在后，让不同用户的问候指令共享相同前缀，提高 LLM 的 prompt cache 命中率
+_GREETING_PROMPT_TEMPLATE = (
+    "Begin by exchanging pleasantries with the user and wait for the user's reply. "
+    "Be like a friend or a foreigner english teacher, not an assistant. "
+    "Keep it simple and natural. Just one short sentence. "
+    "Once the user responds, silently call the transfer_to_teaching_agent function to hand off the conversation to the teaching agent, without exposing the switch."
+    "\n Here is some information that may be useful for context: "
+    "\n - The user's nickname is {nickname}"
+    "{history_context}"
+    "{time_info}"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _now_iso(epoch_second: int) -> str:
+    """北京时间的 ISO 字符串，同一秒内复用"""
+    return datetime.fromtimestamp(epoch_second, _BEIJING_TZ).isoformat()
+
+
+def _resolve_teaching_agent(phase: VocabularyPhase) -> type[LivekitAgent]:
+    if phase == VocabularyPhase.ANALYSIS_ROUTE:
+        return route_analysis.RouteAnalysisAgent
+    return main_schedule_agent.MainScheduleAgent
+
+
 class GreetingAgent(LivekitAgent):
     def __init__(self, context: AgentContext, room: rtc.Room) -> None:
         self.context = context
         self.room = room
-        nickname = context.user_info.nick_name
-
-        # 获取北京时间
-        beijing_tz = pytz.timezone('Asia/Shanghai')
-        now = datetime.now(beijing_tz)
-
-        instructions = self._build_instructions(nickname, now, context.last_communication_time)
-
+        # 问候指令依赖历史和当前时间，推迟到 on_enter 再构建，不占用入会的关键路径
         super().__init__(
-            instructions=instructions,
+            instructions="",
         )
 
     def _get_history_chat_str(self) -> str:
-        history_str = ""
-        for item in self.context.chat_context.items:
+        # 只保留最近的 _HISTORY_WINDOW 条消息，从后往前收集
+        lines = []
+        for item in reversed(self.context.chat_context.items):
+            if len(lines) >= _HISTORY_WINDOW:
+                break
             if not isinstance(item, LivekitChatMessage):
                 continue
+            prefix = _ROLE_PREFIX.get(item.role)
+            if prefix is not None:
+                lines.append(f"{prefix}{item.text_content}\n")
 
-            match item.role:
-                case "user":
-                    history_str += f"User：{item.text_content}\n"
-                case "assistant":
-                    history_str += f"AI Teacher：{item.text_content}\n"
-                case _:
-                    continue
-
-        return history_str
+        lines.reverse()
+        return "".join(lines)
 
-    def _build_instructions(self, nickname: str, now: datetime, last_communication_time: datetime | None) -> str:
+    def _build_instructions(self, nickname: str, now_iso: str, last_communication_time: datetime | None) -> str:
         """Build greeting instructions based on user context."""
 
         if last_communication_time:
-            time_info = f"\n - The last interaction was at {last_communication_time.isoformat()}, current time is {now.isoformat()}"
+            time_info = f"\n - The last interaction was at {last_communication_time.isoformat()}, current time is {now_iso}"
         else:
-            time_info = f"\n - This is the first vocabulary learning session of the day, current time is {now.isoformat()}"
+            time_info = f"\n - This is the first vocabulary learning session of the day, current time is {now_iso}"
   
-        history_str = self._get_history_chat_str()
+        history_str = self._get_history_chat_str() if self.context.chat_context.items else ""
         if history_str:
-            history_context = f"- Previous conversation history for context: ```{history_str}```"
+            history_context = f"\n - Previous conversation history for context: ```{history_str}```"
         else:
             history_context = ""
 
         return prompt_with_voice_mindset_instructions(
-            f"Begin by exchanging pleasantries with the user {nickname} and wait for the user's reply."
-            f"Be like a friend or a foreigner english teacher, not an assistant. "
-            f"Keep it simple and natural. Just one short sentence."
-            f"Once the user responds, silently call the start_learning function to hand off the conversation to the teaching agent, without exposing the switch."
-            f"\n Here is some information that may be useful for context: "
-            f"{time_info}"
-            f"{history_context}"
+            _GREETING_PROMPT_TEMPLATE.format(nickname=nickname, time_info=time_info, history_context=history_context)
         )
 
     async def on_enter(self):
         logger.info(f"GreetingAgent on_enter")
+        # 获取北京时间
+        now_iso = _now_iso(int(time.time()))
+        instructions = self._build_instructions(self.context.user_info.nick_name, now_iso, self.context.last_communication_time)
+        await self.update_instructions(instructions)
         await self.session.generate_reply(allow_interruptions=False)
 
     @function_tool
@@ -80,24 +104,16 @@ class GreetingAgent(LivekitAgent):
         context: RunContext[AgentContext],
     ):
         """Dispatch the conversation to the appropriate teaching agent based on user context."""
-        
-        from agents.vocab.agents.route_analysis import RouteAnalysisAgent
-        from agents.vocab.agents.main_schedule_agent import MainScheduleAgent
-        from agents.vocab.context import VocabularyPhase
-        
         try:
             logger.info(f"handoff_to_teaching_agent: {context.userdata.phase}")
             agent_context = context.userdata
 
-            for item in self._chat_ctx.items:
-                agent_context.chat_context.insert(item)
+            agent_context.chat_context.items.extend(self._chat_ctx.items)
+            agent_context.schedule_history_compaction()
 
-            logger.info(f"chat_context: {self._chat_ctx.to_dict()}")
-            logger.info(f"chat_context: {agent_context.chat_context.to_dict()}")
-            if context.userdata.phase == VocabularyPhase.ANALYSIS_ROUTE:
-                agent = RouteAnalysisAgent(context=agent_context, room=context.room)
-            else:
-                agent = MainScheduleAgent(context=agent_context, room=context.room)
+            logger.debug(f"greeting items: {len(self._chat_ctx.items)}, chat_context items: {len(agent_context.chat_context.items)}")
+            agent_cls = _resolve_teaching_agent(agent_context.phase)
+            agent = agent_cls(context=agent_context, room=context.room)
 
             return agent, None
         except Exception as e:
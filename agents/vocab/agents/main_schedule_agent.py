@@ -1,64 +1,79 @@
-from bamboo_shared.agent.instructions import TemplateVariables, get_instructions
+from agents.vocab.agents._instruction_cache import render_instructions
 from livekit.agents import (
     RunContext,
 )
 from livekit.agents.llm import function_tool, ChatContext
 from agents.vocab.context import AgentContext
 from bamboo_shared.logger import get_logger
-from livekit.agents import Agent as LivekitAgent
-from bamboo_shared.enums.vocabulary import (
-    VocabularyPhase,
-    SentenceType
-)
+from agents.vocab.agents._base import VocabTeachingAgent
+# route_analysis imports this module back, so bind the module and resolve the class at call time
+from agents.vocab.agents import route_analysis
+from bamboo_shared.enums.vocabulary import VocabularyPhase
 from typing import Annotated
-from bamboo_shared.models import UserWrittenSentence
-from bamboo_shared.repositories.user_written_sentence import UserWrittenSentenceRepository
 from livekit import rtc
 
+import asyncio
 import json
 
 logger = get_logger(__name__)
 
-class MainScheduleAgent(LivekitAgent):
+# Map phase to instruction key
+_PHASE_INSTRUCTION_KEY = {
+    VocabularyPhase.WORD_CREATION_LOGIC: "word_creation_logic",
+    VocabularyPhase.SYNONYM_DIFFERENTIATION: "synonym_differentiation",
+    VocabularyPhase.CO_OCCURRENCE: "co_occurrence",
+    VocabularyPhase.QUESTION_ANSWER: "sentence_practice",
+}
+
+# 单词学习阶段的流转，QUESTION_ANSWER 之后当前单词完成
+_NEXT_PHASE = {
+    VocabularyPhase.WORD_CREATION_LOGIC: VocabularyPhase.SYNONYM_DIFFERENTIATION,
+    VocabularyPhase.SYNONYM_DIFFERENTIATION: VocabularyPhase.CO_OCCURRENCE,
+    VocabularyPhase.CO_OCCURRENCE: VocabularyPhase.QUESTION_ANSWER,
+    VocabularyPhase.QUESTION_ANSWER: None,
+}
+
+
+def render_phase_instructions(context: AgentContext, phase: VocabularyPhase) -> str:
+    """Render the MainScheduleAgent instructions of a phase"""
+    instruction_key = _PHASE_INSTRUCTION_KEY.get(phase, "word_creation_logic")
+    return render_instructions(
+        instruction_key,
+        **context.template_variables,
+        similar_words=context.similar_words_joined,
+        voice_mode=True,
+    )
+
+
+class MainScheduleAgent(VocabTeachingAgent):
     def __init__(self, context: AgentContext, room: rtc.Room) -> None:
         self.context = context
-        self.room = room
-        instructions = self._get_current_instructions()
-        
-        super().__init__(
-            instructions=instructions,
-            chat_ctx=context.chat_context
-        )
+        super().__init__(context, room, self._get_current_instructions())
 
-    def _get_current_instructions(self) -> str:
-        """Get instructions for the current phase from context"""
-        similar_words = self.context.word.similar_words
-        if similar_words:
-            similar_words = ", ".join(similar_words)
-        else:
-            similar_words = ""
-
-        template_variables = TemplateVariables(
-            word=self.context.word.word,
-            nickname=self.context.user_info.nick_name,
-            user_english_level=self.context.get_formatted_english_level(),
-            user_characteristics=self.context.get_formatted_characteristics(),
-            similar_words=similar_words
-        )
-        
-        # Map phase to instruction key
-        phase_mapping = {
-            VocabularyPhase.WORD_CREATION_LOGIC: "word_creation_logic",
-            VocabularyPhase.SYNONYM_DIFFERENTIATION: "synonym_differentiation", 
-            VocabularyPhase.CO_OCCURRENCE: "co_occurrence",
-            VocabularyPhase.QUESTION_ANSWER: "sentence_practice"
-        }
-        
-        instruction_key = phase_mapping.get(self.context.phase, "word_creation_logic")
-        return get_instructions(template_variables, instruction_key, voice_mode=True)
+    def _get_current_instructions(self, phase: VocabularyPhase | None = None) -> str:
+        """Get instructions for the given phase, defaulting to the current phase from context"""
+        return render_phase_instructions(self.context, phase or self.context.phase)
+
+    def _next_phase(self) -> VocabularyPhase | None:
+        """Phase that follows the current one for this word, None once the word is completed"""
+        current_phase = self.context.phase
+        if current_phase == VocabularyPhase.WORD_CREATION_LOGIC and not self.context.word.similar_words:
+            # 没有近义词时跳过近义词辨析
+            return VocabularyPhase.CO_OCCURRENCE
+        return _NEXT_PHASE.get(current_phase, current_phase)
 
     async def on_enter(self):
-        await self.session.generate_reply()
+        await super().on_enter()
+        next_phase = self._next_phase()
+        if next_phase is not None and next_phase != self.context.phase:
+            # 等待用户回复期间预先渲染下一阶段的指令
+            self._prewarm_task = asyncio.create_task(self._prewarm_instructions(next_phase))
+
+    async def _prewarm_instructions(self, phase: VocabularyPhase):
+        try:
+            await asyncio.to_thread(self._get_current_instructions, phase)
+        except Exception as e:
+            logger.warning(f"Failed to prewarm instructions for phase {phase}: {e}")
 
     @function_tool
     async def transfer_to_main_schedule_agent(
@@ -66,31 +81,17 @@ class MainScheduleAgent(LivekitAgent):
         context: RunContext[AgentContext],
     ):
         """Handoff to the Main Schedule Agent agent to handle the request."""
-        current_phase = self.context.phase
-        
         context.userdata.chat_context = context.session._chat_ctx
+        context.userdata.schedule_history_compaction()
 
-        if current_phase == VocabularyPhase.WORD_CREATION_LOGIC:
-            similar_words = self.context.word.similar_words
-            if similar_words and len(similar_words) > 0:
-                self.context.phase = VocabularyPhase.SYNONYM_DIFFERENTIATION
-            else:
-                self.context.phase = VocabularyPhase.CO_OCCURRENCE
-                
-        elif current_phase == VocabularyPhase.SYNONYM_DIFFERENTIATION:
-            self.context.phase = VocabularyPhase.CO_OCCURRENCE
-            
-        elif current_phase == VocabularyPhase.CO_OCCURRENCE:
-            self.context.phase = VocabularyPhase.QUESTION_ANSWER
-            
-        elif current_phase == VocabularyPhase.QUESTION_ANSWER:
+        next_phase = self._next_phase()
+        if next_phase is None:
             # 完成当前单词，转到下一个单词
-            from agents.vocab.agents.route_analysis import RouteAnalysisAgent
             logger.info("Current word completed, transferring to RouteAnalysisAgent for next word")
-            agent = RouteAnalysisAgent(context=context.userdata, room=self.room)
+            agent = route_analysis.RouteAnalysisAgent(context=context.userdata, room=self.room)
             return agent, None
-        
-        await self.update_instructions(self._get_current_instructions())
+
+        self.context.phase = next_phase
         return MainScheduleAgent(context=context.userdata, room=self.room), None
 
     @function_tool
@@ -99,16 +100,16 @@ class MainScheduleAgent(LivekitAgent):
         context: RunContext[AgentContext],
     ):
         """Handoff to the Next Word Agent agent to handle the request."""
-        from agents.vocab.agents.route_analysis import RouteAnalysisAgent
         logger.info("Current word completed, transferring to RouteAnalysisAgent for next word")
         context.userdata.chat_context = context.session._chat_ctx
+        context.userdata.schedule_history_compaction()
         next_word = await context.userdata.go_next_word()
 
         if not next_word:
             logger.info("No next word available, returning None")
             return "No next word available"
         
-        agent = RouteAnalysisAgent(context=context.userdata, room=self.room)
+        agent = route_analysis.RouteAnalysisAgent(context=context.userdata, room=self.room)
         
         await self.room.local_participant.publish_data(
             payload=json.dumps({"transferd_word_id": next_word.id}).encode("utf-8"),
@@ -116,55 +117,3 @@ class MainScheduleAgent(LivekitAgent):
             topic="vocabulary/word_transfer"
         )
         return agent, None
-
-
-    @function_tool
-    async def save_sentence_evaluation(
-        self,
-        sentence: str,
-        grammar_accuracy: int,
-        vocabulary_proficiency: int,
-        sentence_complexity: int,
-        sentence_type: SentenceType,
-        explanation: str,
-        corrected_sentence: str,
-        native_sentence: str,
-        user_sentence_mean_cn: str
-    ):
-        """
-        Save the sentence evaluation result
-        
-        Args:
-            sentence: 用户提供的原始句子
-            grammar_accuracy: 语法准确性评分(0-10分)
-            vocabulary_proficiency: 词汇运用评分(0-10分)
-            sentence_complexity: 句子复杂度评分(0-10分)
-            sentence_type: 句子类型(1-简单句, 2-复合句, 3-复杂句)
-            explanation: 评分解释和详细反馈
-            corrected_sentence: 语法或表达的修改建议
-            native_sentence: 更地道、自然的表达方式
-            user_sentence_mean_cn: 用户句子的中文含义
-        
-        Returns:
-            操作结果确认信息
-        """
-        try:
-            sentence_repo = UserWrittenSentenceRepository(self.context.user_id)
-            await sentence_repo.add(UserWrittenSentence(
-                user_id=self.context.user_id,
-                chat_id=self.context.chat_id,
-                word_id=self.context.word.id,
-                user_sentence=sentence,
-                user_sentence_mean_cn=user_sentence_mean_cn,
-                grammar_accuracy=grammar_accuracy,
-                vocabulary_proficiency=vocabulary_proficiency,
-                sentence_complexity=sentence_complexity,
-                sentence_type=sentence_type,
-                gpt_analyze=explanation,
-                gpt_corrected_sentence=corrected_sentence,
-                gpt_native_sentence=native_sentence,
-            ))
-            return "evaluation saved"
-        except Exception as e:
-            logger.error(f"Error saving sentence evaluation: {e}")
-            return "evaluation failed"
\ No newline at end of file
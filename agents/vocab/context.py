@@ -1,6 +1,7 @@
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, List, Sequence
 from bamboo_shared.models import (
     User,
@@ -8,6 +9,7 @@ from bamboo_shared.models import (
     ChatReference,
     ChatMessage,
     Chat,
+    UserWrittenSentence,
 )
 from bamboo_shared.enums.vocabulary import VocabularyPhase
 from bamboo_shared.repositories import (
@@ -16,6 +18,7 @@ from bamboo_shared.repositories import (
     ChatReferenceRepository,
     VocabularyRepository,
 )
+from bamboo_shared.repositories.user_written_sentence import UserWrittenSentenceRepository
 from bamboo_shared.service.vocabulary import WordTask, VocabPlanService
 from bamboo_shared.logger import get_logger
 from livekit.agents.llm.chat_context import ChatContext, ChatItem, FunctionCall, FunctionCallOutput, ChatMessage as LivekitChatMessage
@@ -24,6 +27,18 @@ import uuid
 
 logger = get_logger(__name__)
 
+# 教学 agent 只带入最近这么多条历史，超过后较早的消息会被压缩为摘要
+HISTORY_MAX_ITEMS = 40
+_HISTORY_KEEP_RECENT = 20
+_HISTORY_SUMMARY_MODEL = "gpt-4.1-mini"
+# 关闭时等待后台句子评估写库的最长时间（秒）
+_SENTENCE_SAVE_TIMEOUT = 5.0
+_HISTORY_SUMMARY_PROMPT = (
+    "Summarize this English vocabulary lesson between a student and an AI teacher. "
+    "Keep the words covered, the student's mistakes and progress, and anything the student shared about themselves. "
+    "Be concise."
+)
+
 
 class ContextInitializationError(Exception):
     """Raised when agent context initialization fails"""
@@ -95,6 +110,21 @@ class Context:
         """get the formatted English level"""
         return str(self.english_level)
 
+    @cached_property
+    def template_variables(self) -> Dict[str, str]:
+        """instruction template variables of the current word, shared by every agent"""
+        return {
+            "word": self.word.word,
+            "nickname": self.user_info.nick_name,
+            "user_english_level": self.get_formatted_english_level(),
+            "user_characteristics": self.get_formatted_characteristics(),
+        }
+
+    @cached_property
+    def similar_words_joined(self) -> str:
+        """similar words of the current word, joined for the instruction templates"""
+        return ", ".join(self.word.similar_words or ())
+
     def get_image_url(self) -> str:
         IMAGE_URL_PREFIX = "https://platform.bambooai.top/api/file/images/key"
         return f"{IMAGE_URL_PREFIX}/{self.word.sentence_image_key}"
@@ -146,13 +176,15 @@ class Context:
             parent_chat_id = self.chat_reference.chat_id
             prev_chat = await chat_repo.get_chat(parent_chat_id)
 
-            logger.info(f"Transitioning to next word: {next_word.word}, prev_chat: {prev_chat.to_dict() if prev_chat else None}, parent_chat_id: {parent_chat_id}")
+            logger.info(f"Transitioning to next word: {next_word.word}, prev_chat: {prev_chat.id if prev_chat else None}, parent_chat_id: {parent_chat_id}")
             self.chat_id = chat_id
             
             if not prev_chat or not prev_chat.current_node:
                 raise ValueError(f"prev_chat.current_node is None, parent_chat_id: {parent_chat_id} prev_chat: {prev_chat}")
 
             self.word = next_word
+            self.__dict__.pop("template_variables", None)
+            self.__dict__.pop("similar_words_joined", None)
             self.phase = VocabularyPhase.WORD_CREATION_LOGIC
             self.chat_reference = await vocab_repo.ensure_chat_reference(
                 next_word.id, chat_id
@@ -173,6 +205,7 @@ class AgentContext(Context):
         self.chat_reference_repo = ChatReferenceRepository(user_id)
         self.word_repo = VocabularyRepository(user_id)
         self.user_repo = UserRepository(user_id)
+        self.sentence_repo = UserWrittenSentenceRepository(user_id)
         self.english_level = UserEnglishLevel(
             listening=EnglishLevel.A1,
             reading=EnglishLevel.A1,
@@ -183,33 +216,138 @@ class AgentContext(Context):
         self.chat_history = []
         self.last_communication_time = None
         self.current_node = None
+        self.history_summary = ""
+        # 已经并入 history_summary 的消息 id；chat_context 每次切换 agent 都会整体替换，不能用下标记录
+        self._summarized_ids: set[str] = set()
+        self._compact_lock = asyncio.Lock()
+        self._compact_tasks: set[asyncio.Task] = set()
+        self._summary_llm = None
+        # 后台保存中的句子评估，保留引用避免任务被回收，关闭时等待写完
+        self._sentence_saves: set[asyncio.Task] = set()
+        self._word_future: asyncio.Future | None = None
 
     def update_chat_current_node(self, message_id: str):
         self.current_node = message_id
 
+    def _pending_summary_messages(self, items: Sequence[ChatItem], keep_recent: int) -> list[LivekitChatMessage]:
+        """最近 keep_recent 条之前、还没有并入摘要的消息"""
+        if len(items) <= HISTORY_MAX_ITEMS:
+            return []
+        return [
+            item
+            for item in items[:len(items) - keep_recent]
+            if isinstance(item, LivekitChatMessage)
+            and item.role in ("user", "assistant")
+            and item.text_content
+            and item.id not in self._summarized_ids
+        ]
+
+    def save_sentence_in_background(self, sentence: UserWrittenSentence):
+        """后台保存句子评估，不阻塞下一轮回复"""
+        task = asyncio.create_task(self._save_sentence(sentence))
+        self._sentence_saves.add(task)
+        task.add_done_callback(self._sentence_saves.discard)
+
+    async def _save_sentence(self, sentence: UserWrittenSentence):
+        try:
+            await self.sentence_repo.add(sentence)
+        except Exception as e:
+            logger.error(f"Error saving sentence evaluation: {e}")
+
+    async def flush_sentence_saves(self):
+        """Wait for the background sentence saves, dropping the ones still running after the timeout."""
+        if not self._sentence_saves:
+            return
+        _, pending = await asyncio.wait(set(self._sentence_saves), timeout=_SENTENCE_SAVE_TIMEOUT)
+        if pending:
+            logger.error(f"Timed out saving sentence evaluations after {_SENTENCE_SAVE_TIMEOUT}s, dropping {len(pending)} unsaved evaluations")
+            for task in pending:
+                task.cancel()
+
+    def schedule_history_compaction(self):
+        """在后台压缩较早的历史，不阻塞当前的 agent 切换"""
+        # 切换 agent 时历史会被截断，这里同步取快照，保证被截掉的消息仍会进入摘要
+        messages = self._pending_summary_messages(self.chat_context.items, _HISTORY_KEEP_RECENT)
+        if not messages:
+            return
+        task = asyncio.create_task(self.compact_history(messages))
+        self._compact_tasks.add(task)
+        task.add_done_callback(self._compact_tasks.discard)
+
+    async def compact_history(self, messages: Sequence[LivekitChatMessage] | None = None):
+        """把给定的消息（默认为当前历史中较早的消息）合并进 history_summary"""
+        if messages is None:
+            messages = self._pending_summary_messages(self.chat_context.items, _HISTORY_KEEP_RECENT)
+
+        # 串行执行，后一次压缩基于前一次的摘要
+        async with self._compact_lock:
+            messages = [item for item in messages if item.id not in self._summarized_ids]
+            if not messages:
+                return
+
+            lines = [f"{item.role}: {item.text_content}" for item in messages]
+            if self.history_summary:
+                lines.insert(0, f"Summary so far: {self.history_summary}")
+
+            summary_ctx = ChatContext()
+            summary_ctx.add_message(role="system", content=_HISTORY_SUMMARY_PROMPT)
+            summary_ctx.add_message(role="user", content="\n".join(lines))
+            try:
+                parts = []
+                async with self._get_summary_llm().chat(chat_ctx=summary_ctx) as stream:
+                    async for chunk in stream:
+                        if chunk.delta and chunk.delta.content:
+                            parts.append(chunk.delta.content)
+            except Exception as e:
+                logger.error(f"Failed to compact chat history for user_id {self.user_id}: {e}")
+                return
+
+            self.history_summary = "".join(parts).strip()
+            self._summarized_ids.update(item.id for item in messages)
+            logger.info(f"Compacted {len(messages)} history messages into summary for user_id {self.user_id}")
+
+    def _get_summary_llm(self):
+        if self._summary_llm is None:
+            from livekit.plugins import openai
+
+            self._summary_llm = openai.LLM(model=_HISTORY_SUMMARY_MODEL)
+        return self._summary_llm
+
+    async def aclose(self):
+        """Stop pending history compaction and close the summary LLM."""
+        for task in list(self._compact_tasks):
+            task.cancel()
+        if self._summary_llm is not None:
+            await self._summary_llm.aclose()
+            self._summary_llm = None
+
     async def initialize_async_context(self):
         """Initialize all async context components with proper error handling"""
         try:
             start_time = asyncio.get_event_loop().time()
-            
-            # Initialize word and user info first (they can run in parallel)
-            user_task = asyncio.create_task(self._initialize_user_info())
-            word_task = asyncio.create_task(self._initialize_word_task())
-            
-            await asyncio.gather(user_task, word_task)
-            user_word_time = asyncio.get_event_loop().time()
-            
-            # Initialize chat context after word is available
-            await self._initialize_chat_context()
-            
+
+            # 单词只查询一次，新建 chat 和单词任务共用同一个 future，chat context 不再等待单词加载完成
+            self._word_future = asyncio.ensure_future(self.word_repo.get_by_id(self.word_id))
+            await asyncio.gather(
+                self._initialize_user_info(),
+                self._initialize_word_task(),
+                self._initialize_chat_context(),
+            )
+
             total_time = asyncio.get_event_loop().time() - start_time
-            chat_time = asyncio.get_event_loop().time() - user_word_time
-            
-            logger.info(f"Context initialization completed - Total: {total_time:.2f}s, Chat context: {chat_time:.2f}s")
+            logger.info(f"Context initialization completed - Total: {total_time:.2f}s")
             
         except Exception as e:
             logger.error(f"Unexpected error during context initialization: {e}")
             raise ContextInitializationError(f"Context initialization failed: {e}") from e
+        finally:
+            # gather 在首个异常时就返回，单词查询可能还在进行或其异常无人读取
+            word_future = self._word_future
+            if word_future is not None:
+                if not word_future.done():
+                    word_future.cancel()
+                elif not word_future.cancelled():
+                    word_future.exception()
 
     async def _initialize_chat_context(self):
         chat_start_time = asyncio.get_event_loop().time()
@@ -217,12 +355,16 @@ class AgentContext(Context):
         logger.info(f"Initializing chat context for user_id: {self.user_id}, word_id: {self.word_id}, chat_id: {self.chat_id}")
         if not self.chat_id:
             # New chat creation - minimal overhead
+            # 先确认单词存在，避免为不存在的单词创建 chat
+            word = await self._word_future
+            if not word:
+                raise ValueError(f"Word not found, word_id: {self.word_id}")
             self.chat_id = str(uuid.uuid4())
             chat_task = asyncio.create_task(self.chat_repo.create_chat(Chat(
                 id=self.chat_id,
                 user_id=self.user_id,
                 type="vocabulary",
-                title=self.word.word,
+                title=word.word,
             )))
             chat_ref_task = asyncio.create_task(self.chat_reference_repo.create(ChatReference(
                 user_id=self.user_id,
@@ -294,14 +436,16 @@ class AgentContext(Context):
     async def _initialize_word_task(self):
         """Initialize word and task information with proper error handling"""
         try:
-            # Initialize word first
-            self.word = await self.word_repo.get_by_id(self.word_id)
-            if not self.word:
-                raise ValueError(f"Word not found, word_id: {self.word_id}")
-            
-            # Initialize task list
+            # Word and task list are independent, fetch them together
             service = VocabPlanService()
-            self.task_list = await service.get_daily_word_task_detail(self.user_id)
+            word, task_list = await asyncio.gather(
+                self._word_future,
+                service.get_daily_word_task_detail(self.user_id),
+            )
+            if not word:
+                raise ValueError(f"Word not found, word_id: {self.word_id}")
+            self.word = word
+            self.task_list = task_list
             
             logger.debug(f"Word task initialized for word_id: {self.word_id}, word: {self.word.word}")
             
@@ -330,7 +474,6 @@ class AgentContext(Context):
                     logger.debug(f"Skipping agent handoff function call: {function_name}")
                     continue
                     
-                logger.info(f"msg.content: {msg.content}")
                 chat_context_items.append(FunctionCall(
                     id=msg.id,
                     type="function_call",
@@ -354,7 +497,6 @@ class AgentContext(Context):
                     is_error=True if msg.content["error"] else False,
                 ))
             elif msg.type == "message" and msg.content is not None:
-                logger.info(f"msg.type: {msg.type}")
                 chat_context_items.append(LivekitChatMessage(
                     id=msg.id,
                     type="message",
@@ -363,4 +505,5 @@ class AgentContext(Context):
                     created_at=msg.create_time.timestamp(),
                 ))
 
+        logger.debug(f"Converted {len(chat_history)} history messages into {len(chat_context_items)} chat items")
         return ChatContext(items=chat_context_items)
@@ -1,11 +1,9 @@
 from bamboo_shared.enums.vocabulary import VocabularyPhase
-from dotenv import load_dotenv
 from agents.vocab.context import AgentContext
 from livekit.plugins import deepgram
 from plugins.tokenizer.mixedLanguageTokenizer import install_mixed_language_tokenize
 from livekit import rtc
 
-load_dotenv(dotenv_path=".env.local")
 install_mixed_language_tokenize()
 
 from livekit.agents import (
@@ -89,6 +87,9 @@ async def vocab_entrypoint(ctx: JobContext, metadata: dict):
         logger.info(f"Usage: {summary}")
 
     ctx.add_shutdown_callback(log_usage)
+    ctx.add_shutdown_callback(event_service.aclose)
+    ctx.add_shutdown_callback(context.flush_sentence_saves)
+    ctx.add_shutdown_callback(context.aclose)
 
     logger.info(f"Starting session for user {user_id} and word {word_id}")
     await session.start(
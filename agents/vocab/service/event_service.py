@@ -2,109 +2,143 @@ import asyncio
 from livekit.agents import AgentSession, ConversationItemAddedEvent, FunctionToolsExecutedEvent
 from livekit.agents.llm import ChatMessage as LivekitChatMessage
 from bamboo_shared.logger import get_logger
+from bamboo_shared.models.Chat import ChatMessage
 from agents.vocab.service.message_service import MessageService
 from agents.vocab.context import AgentContext
 
 logger = get_logger(__name__)
 
+# 单次写库合并的最大消息条数
+_SAVE_BATCH_SIZE = 32
+# 关闭时等待剩余消息写库的最长时间（秒）
+_FLUSH_TIMEOUT = 5.0
+
+
 class EventService:
     def __init__(self, context: AgentContext, session: AgentSession):
         self.context = context
         self.session = session
         self.message_service = MessageService(self.context.user_id, context)
+        # 消息由单个后台任务按顺序写库，写库期间到达的消息合并为一批
+        self._queue: asyncio.Queue[ChatMessage] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._in_flight = 0
 
     def init_event_handlers(self):
         @self.session.on("conversation_item_added")
         def on_conversation_item_added(event: ConversationItemAddedEvent):
             """Save messages when they are added to the conversation."""
-            asyncio.create_task(self._handle_conversation_item_added(event))
-        
+            self._handle_conversation_item_added(event)
+
         @self.session.on("function_tools_executed")
         def on_function_tools_executed(event: FunctionToolsExecutedEvent):
             """Save function calls and outputs when tools are executed."""
-            asyncio.create_task(self._handle_function_tools_executed(event))
+            self._handle_function_tools_executed(event)
 
+    def _enqueue(self, message: ChatMessage):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._queue.put_nowait(message)
 
-    async def _handle_conversation_item_added(self, event: ConversationItemAddedEvent):
-        """Handle conversation item added event and save to database."""
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < _SAVE_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._in_flight = len(batch)
+            try:
+                await self.message_service.save_many(batch)
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} messages: {e}")
+            finally:
+                self._in_flight = 0
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def aclose(self):
+        """Flush the pending messages and stop the background writer."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=_FLUSH_TIMEOUT)
+        except asyncio.TimeoutError:
+            dropped = self._queue.qsize() + self._in_flight
+            logger.error(f"Timed out flushing messages after {_FLUSH_TIMEOUT}s, dropping {dropped} unsaved messages")
+        finally:
+            self._task.cancel()
+            self._task = None
+
+    def _meta_data(self) -> dict:
+        return {
+            "word_id": self.context.word.id,
+            "word": self.context.word.word,
+            "phase": self.context.phase.value,
+        }
+
+    def _handle_conversation_item_added(self, event: ConversationItemAddedEvent):
+        """Handle conversation item added event and queue it for saving."""
         try:
             item = event.item
-            
+
             # Check if item is a LiveKit ChatMessage
             if not isinstance(item, LivekitChatMessage):
                 logger.debug(f"Skipping non-ChatMessage item: {type(item)}")
                 return
-            
+
             # Extract text content from the content list
             text_content = item.text_content
-            
+
             if not text_content:
                 return
-            
+
+            meta_data = self._meta_data()
+            meta_data["interrupted"] = getattr(item, 'interrupted', False)
             if item.role == "user":
-                await self.message_service.save_user_message(
+                self._enqueue(self.message_service.build_user_message(
                     content=text_content,
-                    meta_data={
-                        "word_id": self.context.word.id,
-                        "word": self.context.word.word,
-                        "phase": self.context.phase.value,
-                        "interrupted": getattr(item, 'interrupted', False)
-                    }
-                )
-                
+                    meta_data=meta_data
+                ))
+
             elif item.role == "assistant":
                 logger.info(f"Saving assistant message: {self.context.phase}")
-                await self.message_service.save_assistant_message(
+                self._enqueue(self.message_service.build_assistant_message(
                     content=text_content,
-                    meta_data={
-                        "word_id": self.context.word.id,
-                        "word": self.context.word.word,
-                        "phase": self.context.phase.value,
-                        "interrupted": getattr(item, 'interrupted', False)
-                    }
-                )
+                    meta_data=meta_data
+                ))
         except Exception as e:
             logger.error(f"Failed to save conversation item: {e}")
-    
-    async def _handle_function_tools_executed(self, event: FunctionToolsExecutedEvent):
-        """Handle function tools executed event and save calls and outputs."""
+
+    def _handle_function_tools_executed(self, event: FunctionToolsExecutedEvent):
+        """Handle function tools executed event and queue calls and outputs for saving."""
         try:
             # Define agent handoff function names to filter out
             agent_handoff_functions = {
                 "transfer_to_teaching_agent",
-                "transfer_to_main_schedule_agent", 
+                "transfer_to_main_schedule_agent",
                 "transfer_to_next_word_agent"
             }
-            
+
             # Save function calls and their outputs (except agent handoffs)
             for func_call, func_output in event.zipped():
                 # Skip agent handoff functions
                 if func_call.name in agent_handoff_functions:
                     logger.debug(f"Skipping agent handoff function: {func_call.name}")
                     continue
-                    
+
                 # Save function call
-                await self.message_service.save_function_call_message(
+                self._enqueue(self.message_service.build_function_call_message(
                     func_call,
-                    meta_data={
-                        "word_id": self.context.word.id,
-                        "word": self.context.word.word,
-                        "phase": self.context.phase.value,
-                    }
-                )
-                logger.info(f"Saved function call: {func_call.name}")
-                
+                    meta_data=self._meta_data()
+                ))
+                logger.info(f"Queued function call: {func_call.name}")
+
                 if func_output:
                     # Save function output
-                    await self.message_service.save_function_output_message(
+                    self._enqueue(self.message_service.build_function_output_message(
                         func_output,
-                        meta_data={
-                            "word_id": self.context.word.id,
-                            "word": self.context.word.word,
-                            "phase": self.context.phase.value,
-                        }
-                    )
-                    logger.info(f"Saved function output for: {func_output.name}")
-                
+                        meta_data=self._meta_data()
+                    ))
+                    logger.info(f"Queued function output for: {func_output.name}")
+
         except Exception as e:
             logger.error(f"Failed to save function tools execution: {e}")
@@ -1,5 +1,5 @@
+from typing import Sequence
 from livekit.agents.llm.chat_context import FunctionCall, FunctionCallOutput
-from bamboo_shared.repositories import ChatRepository
 from bamboo_shared.models.Chat import ChatMessage
 import uuid
 from agents.vocab.context import AgentContext
@@ -11,17 +11,18 @@ class MessageService:
     def __init__(self, user_id: int, context: AgentContext):
         self.user_id = user_id
         self.context = context
-        self.chat_repo = ChatRepository(user_id)
+        # 复用 context 上的仓储，整个会话只有一个 ChatRepository
+        self.chat_repo = context.chat_repo
 
-    async def save_user_message(self, content: str, meta_data: dict | None = None) -> str:
-        """Save a user message to the database and return the message ID."""
+    def build_user_message(self, content: str, meta_data: dict | None = None) -> ChatMessage:
+        """Build a user message following the current node."""
         message_id = str(uuid.uuid4())
-        
+
         chat_id = self.context.chat_id
         if not chat_id:
             raise ValueError("chat_id is None")
-        
-        message = ChatMessage(
+
+        return ChatMessage(
             id=message_id,
             user_id=self.user_id,
             visitor_id=None,
@@ -35,21 +36,15 @@ class MessageService:
             end_turn=True,
             meta_data=meta_data
         )
-        
-        await self.chat_repo.save_messages([message])
-        await self.chat_repo.update_chat_current_node(message_id, chat_id)
-        self.context.update_chat_current_node(message_id)
-        return message_id
 
-    async def save_assistant_message(self, content: str, meta_data: dict | None = None) -> str:
-        """Save an assistant message to the database and return the message ID."""
+    def build_assistant_message(self, content: str, meta_data: dict | None = None) -> ChatMessage:
+        """Build an assistant message following the current node."""
         message_id = str(uuid.uuid4())
         chat_id = self.context.chat_id
         if not chat_id:
             raise ValueError("chat_id is None")
-        
-        
-        message = ChatMessage(
+
+        return ChatMessage(
             id=message_id,
             user_id=self.user_id,
             visitor_id=None,
@@ -63,20 +58,15 @@ class MessageService:
             end_turn=True,
             meta_data=meta_data
         )
-        
-        await self.chat_repo.save_messages([message])
-        await self.chat_repo.update_chat_current_node(message_id, chat_id)
-        self.context.update_chat_current_node(message_id)
-        return message_id
 
-    async def save_function_call_message(self, function_call: FunctionCall, meta_data: dict | None = None) -> str:
-        """Save a function call message to the database and return the message ID."""
+    def build_function_call_message(self, function_call: FunctionCall, meta_data: dict | None = None) -> ChatMessage:
+        """Build a function call message following the current node."""
         message_id = str(uuid.uuid4())
         chat_id = self.context.chat_id
         if not chat_id:
             raise ValueError("chat_id is None")
-        
-        message = ChatMessage(
+
+        return ChatMessage(
             id=message_id,
             user_id=self.user_id,
             visitor_id=None,
@@ -96,20 +86,15 @@ class MessageService:
             end_turn=True,
             meta_data=meta_data
         )
-        
-        await self.chat_repo.save_messages([message])
-        await self.chat_repo.update_chat_current_node(message_id, chat_id)
-        self.context.update_chat_current_node(message_id)
-        return message_id
 
-    async def save_function_output_message(self, function_output: FunctionCallOutput, meta_data: dict | None = None) -> str:
-        """Save a function call output message to the database and return the message ID."""
+    def build_function_output_message(self, function_output: FunctionCallOutput, meta_data: dict | None = None) -> ChatMessage:
+        """Build a function call output message following the current node."""
         message_id = str(uuid.uuid4())
         chat_id = self.context.chat_id
         if not chat_id:
             raise ValueError("chat_id is None")
-        
-        message = ChatMessage(
+
+        return ChatMessage(
             id=message_id,
             user_id=self.user_id,
             visitor_id=None,
@@ -130,8 +115,42 @@ class MessageService:
             end_turn=False,
             meta_data=meta_data
         )
-        
+
+    async def save_user_message(self, content: str, meta_data: dict | None = None) -> str:
+        """Save a user message to the database and return the message ID."""
+        return await self._save(self.build_user_message(content, meta_data))
+
+    async def save_assistant_message(self, content: str, meta_data: dict | None = None) -> str:
+        """Save an assistant message to the database and return the message ID."""
+        return await self._save(self.build_assistant_message(content, meta_data))
+
+    async def save_function_call_message(self, function_call: FunctionCall, meta_data: dict | None = None) -> str:
+        """Save a function call message to the database and return the message ID."""
+        return await self._save(self.build_function_call_message(function_call, meta_data))
+
+    async def save_function_output_message(self, function_output: FunctionCallOutput, meta_data: dict | None = None) -> str:
+        """Save a function call output message to the database and return the message ID."""
+        return await self._save(self.build_function_output_message(function_output, meta_data))
+
+    async def save_many(self, messages: Sequence[ChatMessage]) -> None:
+        """Chain messages after the current node in order and save them in one write."""
+        if not messages:
+            return
+
+        parent_message_id = self.context.current_node
+        current_nodes: dict[str, str] = {}
+        for message in messages:
+            message.parent_message_id = parent_message_id
+            parent_message_id = message.id
+            current_nodes[message.chat_id] = message.id
+
+        await self.chat_repo.save_messages(list(messages))
+        for chat_id, message_id in current_nodes.items():
+            await self.chat_repo.update_chat_current_node(message_id, chat_id)
+        self.context.update_chat_current_node(parent_message_id)
+
+    async def _save(self, message: ChatMessage) -> str:
         await self.chat_repo.save_messages([message])
-        await self.chat_repo.update_chat_current_node(message_id, chat_id)
-        self.context.update_chat_current_node(message_id)
-        return message_id
\ No newline at end of file
+        await self.chat_repo.update_chat_current_node(message.id, message.chat_id)
+        self.context.update_chat_current_node(message.id)
+        return message.id
@@ -2,7 +2,6 @@ from dotenv import load_dotenv
 from plugins.tokenizer.mixedLanguageTokenizer import install_mixed_language_tokenize
 from bamboo_shared.nacos import get_nacos_client
 from bamboo_shared.logger import get_logger
-import os
 
 load_dotenv(dotenv_path=".env.local")
 logger = get_logger(__name__)
@@ -21,12 +20,22 @@ from livekit.agents import (
 from livekit.agents.job import JobRequest
 from livekit.plugins import silero
 
-from agents.entry import entrypoint
-
+from agents.entry import entrypoint, prewarm_routes
+from plugins.aliyun.ali_token import ali_token
 
 
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
+    # Route modules import livekit plugins, which can only be registered on the main thread;
+    # a failure here must stop the worker instead of surfacing on the first job
+    prewarm_routes()
+
+    # Fetch the Aliyun NLS token while idle so the first AliSTT stream skips the refresh;
+    # this only saves latency, so a failure is logged and the worker keeps going
+    try:
+        ali_token.get_token()
+    except Exception as e:
+        logger.warning(f"Failed to prewarm Aliyun token: {e}")
 
 
 async def request_fnc(request: JobRequest):
@@ -1,5 +1,6 @@
 import os
 import json
+import threading
 from aliyunsdkcore.client import AcsClient
 from aliyunsdkcore.request import CommonRequest
 from datetime import datetime, timedelta
@@ -19,11 +20,15 @@ class AliToken:
         )
         self.token = None
         self.expiry_time = None
+        # prewarm and STT streams may fetch concurrently, only one of them refreshes
+        self._lock = threading.Lock()
 
     def get_token(self):
         """Get a valid token, refreshing if necessary"""
         if not self._is_token_valid():
-            self._refresh_token()
+            with self._lock:
+                if not self._is_token_valid():
+                    self._refresh_token()
         return self.token
 
     def _is_token_valid(self):
@@ -287,6 +287,10 @@ class TTS(tts.TTS):
 
         return self._session
 
+    @property
+    def voice_id(self) -> str:
+        return self._opts.voice_id
+
     def prewarm(self) -> None:
         """Prewarm the connection pool by creating a connection in advance."""
         self._pool.prewarm()
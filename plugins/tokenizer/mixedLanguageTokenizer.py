@@ -160,8 +160,15 @@ def mixed_split_words(
     
     return result
 
+_INSTALLED = False
+
+
 def install_mixed_language_tokenize():
     """安装中英文混合tokenize功能，替换LiveKit内部的分词功能"""
+    global _INSTALLED
+    if _INSTALLED:
+        return
+
     # 替换基本函数
     from livekit.agents.tokenize import _basic_hyphenator
     from livekit.agents.tokenize import basic
@@ -171,4 +178,5 @@ def install_mixed_language_tokenize():
     _basic_hyphenator.hyphenate_word = mixed_hyphenate_word
     _basic_word.split_words = mixed_split_words
     basic.hyphenate_word = mixed_hyphenate_word
-    basic.split_words = mixed_split_words
\ No newline at end of file
+    basic.split_words = mixed_split_words
+    _INSTALLED = True
\ No newline at end of file